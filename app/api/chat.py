@@ -2,16 +2,17 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.db.database import get_db
+from app.api.dependencies import get_chat_request, json_body_openapi
+from app.db.database import ReadSessionFactory, get_db, get_read_session
 from app.models.models import ChatMessage
 from app.models.schemas import ChatMessageResponse, ChatRequest, ChatResponse
 from app.services.chat_service import chat_with_transcription
 
 router = APIRouter()
 
-@router.post("/", response_model=ChatResponse)
+@router.post("/", response_model=ChatResponse, openapi_extra=json_body_openapi(ChatRequest))
 async def create_chat_message(
-    chat_request: ChatRequest,
+    chat_request: ChatRequest = Depends(get_chat_request),
     db: Session = Depends(get_db)
 ) -> ChatResponse:
     """
@@ -39,14 +40,17 @@ async def create_chat_message(
 
 
 @router.get("/history/{transcription_id}", response_model=List[ChatMessageResponse])
-def get_chat_history(transcription_id: int, db: Session = Depends(get_db)) -> List[ChatMessageResponse]:
+def get_chat_history(
+    transcription_id: int,
+    read_session: ReadSessionFactory = Depends(get_read_session)
+) -> List[ChatMessageResponse]:
     """
     Get the chat history for a specific transcription.
     """
-    messages = (
-        db.query(ChatMessage)
-        .filter(ChatMessage.transcription_id == transcription_id)
-        .order_by(ChatMessage.created_at)
-        .all()
-    )
-    return messages 
\ No newline at end of file
+    with read_session() as db:
+        return (
+            db.query(ChatMessage)
+            .filter(ChatMessage.transcription_id == transcription_id)
+            .order_by(ChatMessage.created_at, ChatMessage.id)
+            .all()
+        ) 
\ No newline at end of file
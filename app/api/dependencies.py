@@ -0,0 +1,93 @@
+"""
+API Dependencies Module
+
+This module provides FastAPI dependencies that parse hot request bodies.
+
+The bodies are validated straight from the raw JSON bytes with pre-built
+Pydantic TypeAdapters, skipping FastAPI's intermediate decode to Python
+objects. Validation failures are reported as regular 422 responses.
+"""
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from typing import Any, Dict
+
+from app.models.schemas import (
+    ChatRequest,
+    RealTimeTranscriptionRequest,
+    chat_request_adapter,
+    real_time_transcription_request_adapter,
+)
+
+def json_body_openapi(model: Any) -> Dict[str, Any]:
+    """
+    Describe a JSON request body for routes that parse it themselves.
+    
+    Args:
+        model: Pydantic model of the request body
+        
+    Returns:
+        dict: Value for the route's ``openapi_extra``
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+def _validate_body(adapter: TypeAdapter, body: bytes) -> Any:
+    """
+    Validate a raw JSON body, reporting errors the way FastAPI does.
+    
+    Args:
+        adapter: TypeAdapter of the request model
+        body: Raw request body
+        
+    Returns:
+        The validated request model
+        
+    Raises:
+        RequestValidationError: If the body is not valid JSON or does not
+            match the model
+    """
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=body
+        )
+
+
+async def get_chat_request(request: Request) -> ChatRequest:
+    """
+    Dependency parsing the body of a chat request.
+    
+    Args:
+        request: The incoming request
+        
+    Returns:
+        ChatRequest: The validated request body
+    """
+    return _validate_body(chat_request_adapter, await request.body())
+
+
+async def get_real_time_transcription_request(request: Request) -> RealTimeTranscriptionRequest:
+    """
+    Dependency parsing the body of a real-time transcription request.
+    
+    Validation includes decoding the base64 audio, which for multi-MB
+    recordings is done on a worker thread to keep the event loop free.
+    
+    Args:
+        request: The incoming request
+        
+    Returns:
+        RealTimeTranscriptionRequest: The validated request body
+    """
+    body = await request.body()
+    return await run_in_threadpool(_validate_body, real_time_transcription_request_adapter, body)
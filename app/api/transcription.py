@@ -1,15 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status, Request
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, status, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from typing import List
-import base64
+from typing import List, Optional
+import os
 
-from app.db.database import get_db
+from app.api.dependencies import get_real_time_transcription_request, json_body_openapi
+from app.db.database import ReadSessionFactory, get_db, get_read_session
 from app.models.models import Transcription
-from app.models.schemas import TranscriptionResponse, RealTimeTranscriptionRequest, RealTimeTranscriptionResponse
+from app.models.schemas import (
+    TranscriptionResponse,
+    TranscriptionSummary,
+    RealTimeTranscriptionRequest,
+    RealTimeTranscriptionResponse,
+)
 from app.services.transcription_service import transcribe_audio, transcribe_audio_data
+from app.services.chat_service import invalidate_transcription_content
+from app.services.retrieval_service import index_transcription
 
 router = APIRouter()
 
+# Audio formats accepted for upload
+_ALLOWED_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".mp4", ".mpeg", ".mpga", ".webm"})
+_INVALID_EXTENSION_DETAIL = f"Invalid file type. Allowed types: {', '.join(sorted(_ALLOWED_EXTENSIONS))}"
+
 @router.post("/", response_model=TranscriptionResponse)
 async def create_transcription(
     file: UploadFile = File(...),
@@ -24,14 +38,13 @@ async def create_transcription(
             detail="No file provided"
         )
     
-    # Check file type (optional enhancement)
-    allowed_extensions = [".mp3", ".wav", ".m4a", ".mp4", ".mpeg", ".mpga", ".webm"]
-    file_ext = "." + file.filename.split(".")[-1].lower()
+    # Check file type
+    file_ext = os.path.splitext(file.filename)[1].lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in _ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, 
-            detail=f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
+            detail=_INVALID_EXTENSION_DETAIL
         )
     
     try:
@@ -39,7 +52,8 @@ async def create_transcription(
         transcription_text = await transcribe_audio(file)
         
         # Create transcription record
-        db_transcription = await _save_transcription(db, file.filename, transcription_text)
+        db_transcription = await run_in_threadpool(_save_transcription, db, file.filename, transcription_text)
+        await index_transcription(db, db_transcription.id, transcription_text)
         
         return db_transcription
     
@@ -50,27 +64,29 @@ async def create_transcription(
         )
 
 
-@router.post("/real-time", response_model=RealTimeTranscriptionResponse)
+@router.post(
+    "/real-time",
+    response_model=RealTimeTranscriptionResponse,
+    openapi_extra=json_body_openapi(RealTimeTranscriptionRequest)
+)
 async def real_time_transcription(
-    request: RealTimeTranscriptionRequest,
+    request: RealTimeTranscriptionRequest = Depends(get_real_time_transcription_request),
     db: Session = Depends(get_db)
 ) -> RealTimeTranscriptionResponse:
     """
     Transcribe audio data sent in real-time.
     """
     try:
-        # Decode the base64 audio data
-        audio_data = base64.b64decode(request.audio_data)
-        
-        # Call the transcription service
-        transcription_text = await transcribe_audio_data(audio_data, request.file_extension)
+        # The audio data was base64-decoded during request validation
+        transcription_text = await transcribe_audio_data(request.audio_data, request.file_extension)
         
         # Save transcription to database
         db_transcription = None
         # Only save to database if save_to_db is True
         if request.save_to_db:
             filename = f"real-time-recording{request.file_extension}"
-            db_transcription = await _save_transcription(db, filename, transcription_text)
+            db_transcription = await run_in_threadpool(_save_transcription, db, filename, transcription_text)
+            await index_transcription(db, db_transcription.id, transcription_text)
             
         return RealTimeTranscriptionResponse(
             transcription=transcription_text,
@@ -85,11 +101,15 @@ async def real_time_transcription(
 
 
 @router.get("/{transcription_id}", response_model=TranscriptionResponse)
-def get_transcription(transcription_id: int, db: Session = Depends(get_db)) -> TranscriptionResponse:
+def get_transcription(
+    transcription_id: int,
+    read_session: ReadSessionFactory = Depends(get_read_session)
+) -> TranscriptionResponse:
     """
     Get a specific transcription by ID.
     """
-    transcription = db.query(Transcription).filter(Transcription.id == transcription_id).first()
+    with read_session() as db:
+        transcription = db.get(Transcription, transcription_id)
     if not transcription:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
@@ -98,32 +118,59 @@ def get_transcription(transcription_id: int, db: Session = Depends(get_db)) -> T
     return transcription
 
 
-@router.get("/", response_model=List[TranscriptionResponse])
-def list_transcriptions(db: Session = Depends(get_db)) -> List[TranscriptionResponse]:
+@router.get("/", response_model=List[TranscriptionSummary])
+def list_transcriptions(
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = Query(None, ge=1),
+    read_session: ReadSessionFactory = Depends(get_read_session)
+) -> List[TranscriptionSummary]:
     """
-    Get a list of all transcriptions.
+    Get a page of transcriptions, newest first, without their content.
+    
+    Pass the smallest ID of the previous page as ``before_id`` to fetch
+    the next page.
     """
-    return db.query(Transcription).all()
+    with read_session() as db:
+        query = db.query(Transcription).with_entities(
+            Transcription.id,
+            Transcription.filename,
+            Transcription.created_at
+        )
+        if before_id is not None:
+            query = query.filter(Transcription.id < before_id)
+        return query.order_by(Transcription.id.desc()).limit(limit).all()
 
 
-async def _save_transcription(db: Session, filename: str, content: str) -> Transcription:
+def _save_transcription(db: Session, filename: str, content: str) -> TranscriptionResponse:
     """
     Save a transcription to the database.
     
+    This performs blocking database I/O; call it via ``run_in_threadpool``
+    from async endpoints.
+    
     Args:
         db: Database session
         filename: Name of the transcribed file
         content: Transcription text content
         
     Returns:
-        The created transcription record
+        The created transcription
+        
+    Note:
+        The generated ID and timestamp come back from INSERT ... RETURNING,
+        so no follow-up SELECT is needed and the content is not read back.
     """
-    db_transcription = Transcription(
-        filename=filename,
-        content=content
-    )
-    db.add(db_transcription)
+    created = db.execute(
+        insert(Transcription)
+        .values(filename=filename, content=content)
+        .returning(Transcription.id, Transcription.created_at)
+    ).one()
     db.commit()
-    db.refresh(db_transcription)
+    invalidate_transcription_content(created.id)
     
-    return db_transcription 
\ No newline at end of file
+    return TranscriptionResponse(
+        id=created.id,
+        filename=filename,
+        content=content,
+        created_at=created.created_at
+    ) 
\ No newline at end of file
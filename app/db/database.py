@@ -5,16 +5,20 @@ This module handles database connection and configuration using SQLAlchemy.
 It provides the database engine and session management functionality.
 
 Key components:
-- SQLAlchemy engine configuration
-- Session management
+- SQLAlchemy engine and connection pool configuration
+- Session management (per-request and thread-local read sessions)
 - Base model class for ORM
 - Database URL configuration
 """
 
 import os
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Get database URL from environment or use default SQLite
 SQLALCHEMY_DATABASE_URL = os.getenv(
@@ -22,15 +26,79 @@ SQLALCHEMY_DATABASE_URL = os.getenv(
     "sqlite:///./transcription_app.db"
 )
 
-# Create SQLAlchemy engine with SQLite-specific configuration
+
+def _engine_options(database_url: str) -> dict:
+    """
+    Build connection pool options for the configured database.
+    
+    Args:
+        database_url: SQLAlchemy database URL
+        
+    Returns:
+        dict: Keyword arguments for ``create_engine``
+        
+    Note:
+        An in-memory SQLite database only exists for the lifetime of its
+        connection, so it uses a single shared connection (StaticPool).
+        File-backed SQLite and server databases use a sized QueuePool so
+        connections are reused across requests instead of reopened.
+    """
+    url = make_url(database_url)
+    pool_options = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "3600")),
+    }
+    
+    if url.get_backend_name() == "sqlite":
+        connect_args = {"check_same_thread": False}  # Required for SQLite
+        if url.database in (None, "", ":memory:"):
+            return {"connect_args": connect_args, "poolclass": StaticPool}
+        return {"connect_args": connect_args, **pool_options}
+    
+    # Detect connections dropped by the server before handing them out
+    return {"pool_pre_ping": True, **pool_options}
+
+
+# Create SQLAlchemy engine with a pool suited to the database backend
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Required for SQLite
+    **_engine_options(SQLALCHEMY_DATABASE_URL)
 )
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune every new SQLite connection for the app's write-heavy workload.
+
+    WAL lets readers proceed while a write is in progress and, together with
+    synchronous=NORMAL, avoids rewriting and fsyncing a rollback journal on
+    every commit. WAL mode creates ``-wal`` and ``-shm`` files next to the
+    database file.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+    finally:
+        cursor.close()
+
+
+if engine.url.get_backend_name() == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
 # Create session factory for database operations
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Thread-local sessions reused by read-only routes across requests
+ScopedSession = scoped_session(SessionLocal)
+
+# Callable opening a session for the duration of a with-block
+ReadSessionFactory = Callable[[], ContextManager[Session]]
+
 # Create base class for declarative models
 Base = declarative_base()
 
@@ -49,4 +117,41 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close() 
+
+
+@contextmanager
+def read_session() -> Iterator[Session]:
+    """
+    Provide the calling thread's long-lived session for read-only work.
+    
+    Yields:
+        Session: The thread-local SQLAlchemy session
+        
+    Note:
+        The session is closed on exit, which ends its transaction and returns
+        the connection to the pool, but it stays registered to the thread
+        and is reused by the next read on that thread. All use must happen
+        within the with-block on a single thread, i.e. inside a sync route.
+    """
+    session = ScopedSession()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def get_read_session() -> ReadSessionFactory:
+    """
+    Dependency function for read-only routes.
+    
+    Returns:
+        ReadSessionFactory: Context manager factory yielding a session
+        
+    Note:
+        The factory is returned rather than a session because FastAPI may
+        resolve dependencies on a different worker thread than the one
+        running a sync route, and thread-local sessions must be opened on
+        the thread that uses them.
+    """
+    return read_session
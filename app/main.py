@@ -10,22 +10,30 @@ The application provides two main features:
 
 Key components:
 - FastAPI application configuration
+- Application lifespan (startup/shutdown) handling
 - CORS middleware setup
 - Global exception handling
 - API route mounting
 - Static file serving
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 import os
 import logging
 from dotenv import load_dotenv
 
+# Load environment variables from .env file. This must happen before the app
+# modules are imported: they read DATABASE_URL, the DB_POOL_* settings and
+# OPENAI_API_KEY at import time
+load_dotenv()
+
 from app.db.database import engine, Base
 from app.api import transcription, chat
+from app.services import chat_service, retrieval_service, transcription_service
+from app.static_files import CachedStaticFiles
 
 # Configure logging with structured format
 logging.basicConfig(
@@ -34,17 +42,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Load environment variables from .env file
-load_dotenv()
-
-# Initialize database tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manage resources that live for the duration of the application.
+    
+    On startup the database tables are created, unless
+    RUN_MIGRATIONS_ON_STARTUP is set to something other than "1" (for
+    deployments where the schema is managed separately). The async OpenAI
+    clients open their HTTP connection pools lazily on the server's event
+    loop; they are closed here on shutdown.
+    
+    Args:
+        app: The FastAPI application
+    """
+    if os.getenv("RUN_MIGRATIONS_ON_STARTUP", "1") == "1":
+        Base.metadata.create_all(bind=engine)
+    
+    if engine.url.get_backend_name() == "sqlite":
+        logger.info(
+            f"SQLite database at {engine.url.database} uses WAL journaling; "
+            "expect -wal and -shm sidecar files next to it"
+        )
+    
+    yield
+    await chat_service.client.close()
+    await transcription_service.client.close()
+    await retrieval_service.client.close()
 
 # Initialize FastAPI application with metadata
 app = FastAPI(
     title="Audio Transcription and Chat App",
     description="An application that transcribes audio files and allows chatting with the content",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS with allowed origins
@@ -96,12 +127,23 @@ async def api_root():
 app.include_router(transcription.router, prefix="/api/v1/transcriptions", tags=["Transcriptions"])
 app.include_router(chat.router, prefix="/api/v1/chat", tags=["Chat"])
 
-# Mount static files for frontend last to avoid route conflicts
-try:
-    app.mount("/", StaticFiles(directory="frontend", html=True), name="frontend")
-    logger.info("Frontend files mounted successfully")
-except Exception as e:
-    logger.warning(f"Could not mount frontend files: {e}")
+# Mount static files for frontend last to avoid route conflicts. In
+# production the frontend is best served by a CDN or reverse proxy; set
+# SERVE_FRONTEND=0 to leave it out of the app entirely.
+if os.environ.get("SERVE_FRONTEND", "1") == "1":
+    try:
+        app.mount(
+            "/",
+            CachedStaticFiles(
+                directory="frontend",
+                html=True,
+                cache_lookups=os.environ.get("ENVIRONMENT") == "production"
+            ),
+            name="frontend"
+        )
+        logger.info("Frontend files mounted successfully")
+    except Exception as e:
+        logger.warning(f"Could not mount frontend files: {e}")
 
 # Development server entry point
 if __name__ == "__main__":
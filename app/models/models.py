@@ -5,18 +5,62 @@ This module defines the SQLAlchemy ORM models for the application.
 It includes models for transcriptions and chat messages.
 
 Key components:
+- CompressedText column type for large text values
 - Transcription model for storing audio transcriptions
 - ChatMessage model for storing chat history
+- TranscriptionChunk model for storing embedded transcription chunks
 """
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+from typing import Optional, Union
 import datetime
+import zlib
 
 from app.db.database import Base
 
 
+class CompressedText(TypeDecorator):
+    """
+    Text column stored as a zlib-compressed blob.
+    
+    Long transcriptions shrink to a fraction of their size on disk, so more
+    of them fit in SQLite's page cache. Each stored value starts with a
+    marker byte: values under ``min_size`` bytes are kept uncompressed,
+    since compression would barely pay for its header. Plain text values
+    written before this type was introduced are read back unchanged.
+    """
+    
+    impl = LargeBinary
+    cache_ok = True
+    
+    _RAW = b"\x00"
+    _ZLIB = b"\x01"
+    
+    def __init__(self, min_size: int = 2048, level: int = 6, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.min_size = min_size
+        self.level = level
+    
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        data = value.encode("utf-8")
+        if len(data) < self.min_size:
+            return self._RAW + data
+        return self._ZLIB + zlib.compress(data, self.level)
+    
+    def process_result_value(self, value: Union[bytes, str, None], dialect) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        data = bytes(value)
+        if data[:1] == self._ZLIB:
+            return zlib.decompress(data[1:]).decode("utf-8")
+        return data[1:].decode("utf-8")
+
+
 class Transcription(Base):
     """
     SQLAlchemy model for storing audio transcriptions.
@@ -24,7 +68,7 @@ class Transcription(Base):
     Attributes:
         id (int): Primary key
         filename (str): Name of the audio file
-        content (str): Transcribed text content
+        content (str): Transcribed text content, stored compressed
         created_at (datetime): Timestamp of creation
     """
     
@@ -32,7 +76,7 @@ class Transcription(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, nullable=False)
-    content = Column(Text, nullable=False)
+    content = Column(CompressedText, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship with ChatMessage
@@ -49,9 +93,15 @@ class ChatMessage(Base):
         role (str): Message role (user/assistant)
         content (str): Message content
         created_at (datetime): Timestamp of creation
+    
+    The composite index on (transcription_id, created_at) serves both the
+    per-transcription filter and the chronological ordering of chat history.
     """
     
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        Index("ix_chat_messages_tid_created", "transcription_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     transcription_id = Column(Integer, ForeignKey("transcriptions.id"))
@@ -60,4 +110,30 @@ class ChatMessage(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationship with Transcription
-    transcription = relationship("Transcription", back_populates="messages") 
\ No newline at end of file
+    transcription = relationship("Transcription", back_populates="messages") 
+
+
+class TranscriptionChunk(Base):
+    """
+    SQLAlchemy model for storing embedded chunks of long transcriptions.
+    
+    A chunk references a span of its transcription's content rather than
+    copying the text.
+    
+    Attributes:
+        id (int): Primary key
+        transcription_id (int): Foreign key to Transcription
+        position (int): Order of the chunk within the transcription
+        start (int): Offset of the first character of the chunk
+        end (int): Offset just past the last character of the chunk
+        embedding (bytes): Embedding vector as packed float32 values
+    """
+    
+    __tablename__ = "transcription_chunks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    transcription_id = Column(Integer, ForeignKey("transcriptions.id"), nullable=False, index=True)
+    position = Column(Integer, nullable=False)
+    start = Column(Integer, nullable=False)
+    end = Column(Integer, nullable=False)
+    embedding = Column(LargeBinary, nullable=False)
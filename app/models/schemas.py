@@ -8,14 +8,38 @@ Key components:
 - Base schemas for common attributes
 - Request schemas for data validation
 - Response schemas for API responses
+- Pre-built validators for hot request bodies
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, WithJsonSchema
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
+import binascii
 import re
 
 
+def _decode_base64(value: object) -> bytes:
+    """
+    Decode base64 text for a bytes field.
+    
+    Args:
+        value: Raw field value from the request body
+        
+    Returns:
+        bytes: The decoded data
+        
+    Raises:
+        ValueError: If the value is not a string or not valid base64, so
+            Pydantic reports it as a validation error
+    """
+    if not isinstance(value, str):
+        raise ValueError("Input should be a base64 encoded string")
+    try:
+        return binascii.a2b_base64(value)
+    except binascii.Error as e:
+        raise ValueError(f"Invalid base64 data: {e}")
+
+
 class TranscriptionBase(BaseModel):
     """
     Base schema for transcription data.
@@ -47,13 +71,35 @@ class TranscriptionResponse(TranscriptionBase):
     id: int = Field(..., description="Unique identifier for the transcription")
     created_at: datetime = Field(..., description="Timestamp when the transcription was created")
 
-    class Config:
-        """Pydantic configuration for ORM mode."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TranscriptionSummary(BaseModel):
+    """
+    Schema for transcription list entries.
+    
+    Omits the transcribed content so listings stay small.
+    
+    Attributes:
+        id (int): Primary key
+        filename (str): Name of the audio file
+        created_at (datetime): Timestamp of creation
+    """
+    id: int = Field(..., description="Unique identifier for the transcription")
+    filename: str = Field(..., description="Name of the uploaded audio file")
+    created_at: datetime = Field(..., description="Timestamp when the transcription was created")
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RealTimeTranscriptionRequest(BaseModel):
-    audio_data: str = Field(..., description="Base64 encoded audio data")
+    # Base64 is decoded during validation, so the endpoint receives raw bytes;
+    # the JSON schema still describes the base64 string sent on the wire
+    audio_data: Annotated[
+        bytes,
+        BeforeValidator(_decode_base64),
+        WithJsonSchema({"type": "string", "contentEncoding": "base64"})
+    ] = Field(..., description="Base64 encoded audio data")
     file_extension: str = Field(".webm", description="File extension for the audio data")
     save_to_db: bool = Field(False, description="Whether to save the transcription to the database")
 
@@ -96,9 +142,7 @@ class ChatMessageResponse(ChatMessageBase):
     role: str = Field(..., description="Role of the message sender (user or assistant)")
     created_at: datetime = Field(..., description="Timestamp when the message was created")
 
-    class Config:
-        """Pydantic configuration for ORM mode."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChatRequest(BaseModel):
@@ -119,4 +163,9 @@ class ChatHistory(BaseModel):
         messages (List[ChatMessageResponse]): List of chat messages
     """
     transcription_id: int
-    messages: List[ChatMessageResponse] 
\ No newline at end of file
+    messages: List[ChatMessageResponse] 
+
+
+# Built once at import and used to validate raw JSON request bodies directly
+chat_request_adapter = TypeAdapter(ChatRequest)
+real_time_transcription_request_adapter = TypeAdapter(RealTimeTranscriptionRequest)
@@ -8,23 +8,42 @@ Key components:
 - Chat message processing
 - OpenAI API integration
 - Context management
+- Transcription content caching
 - Response generation
+
+Database access goes through a synchronous SQLAlchemy session, so every
+query and commit made from a coroutine is dispatched to the threadpool
+with ``run_in_threadpool`` to keep the event loop free.
 """
 
 import os
+import threading
+from collections import OrderedDict
 import openai
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import Subquery
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 from app.models.models import Transcription, ChatMessage
 from app.models.schemas import ChatMessageCreate, ChatMessageResponse
+from app.services.retrieval_service import select_relevant_content
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Create client using API key from environment
-client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# Transcription content never changes after creation, so chat turns reuse it
+# from an in-process LRU cache instead of reloading the text every time.
+# Lookups happen on threadpool workers, hence the lock.
+_CONTENT_CACHE_SIZE = 1024
+_content_cache: "OrderedDict[int, str]" = OrderedDict()
+_content_cache_lock = threading.Lock()
 
 async def chat_with_transcription(
     db: Session, 
@@ -42,45 +61,144 @@ async def chat_with_transcription(
     Returns:
         The assistant's response
     """
-    # Get the transcription
-    transcription = _get_transcription(db, transcription_id)
-    
-    # Get conversation history
-    conversation_history = _get_conversation_history(db, transcription_id)
+    # Get the transcription content and conversation history
+    transcription_content, conversation_history = await run_in_threadpool(
+        _get_chat_context, db, transcription_id
+    )
     
-    # Save user message
-    _save_message(db, transcription_id, "user", user_message)
+    # Keep only the parts of long transcriptions relevant to this message
+    transcription_content = await select_relevant_content(
+        db, transcription_id, transcription_content, user_message
+    )
     
     # Prepare messages for API call
-    messages = _prepare_messages(transcription.content, conversation_history, user_message)
+    messages = _prepare_messages(transcription_content, conversation_history, user_message)
     
     # Get response from OpenAI
     assistant_message = await _get_chat_completion(messages)
     
-    # Save assistant message
-    _save_message(db, transcription_id, "assistant", assistant_message)
+    # Persist both sides of the turn with one INSERT and one commit
+    await run_in_threadpool(_save_messages, db, [
+        {"transcription_id": transcription_id, "role": "user", "content": user_message},
+        {"transcription_id": transcription_id, "role": "assistant", "content": assistant_message},
+    ])
     
     return assistant_message
 
 
-def _get_transcription(db: Session, transcription_id: int) -> Transcription:
+def _get_chat_context(
+    db: Session, 
+    transcription_id: int, 
+    limit: int = 10
+) -> Tuple[str, List[ChatMessage]]:
     """
-    Get a transcription by ID.
+    Get a transcription's content and its recent conversation history.
+    
+    Cached content only needs the history query. On a cache miss the
+    content is loaded with its own query first: joining it to the history
+    would repeat the compressed blob, and its decompression, on every row.
     
     Args:
         db: Database session
         transcription_id: ID of the transcription
+        limit: Maximum number of history messages to return
         
     Returns:
-        The transcription record
+        The transcription text and the most recent chat messages in
+        chronological order
         
     Raises:
         ValueError: If transcription not found
     """
-    transcription = db.query(Transcription).filter(Transcription.id == transcription_id).first()
-    if not transcription:
-        raise ValueError(f"Transcription with ID {transcription_id} not found")
-    return transcription
+    content = _get_cached_content(transcription_id)
+    if content is None:
+        content = db.scalar(
+            select(Transcription.content).where(Transcription.id == transcription_id)
+        )
+        if content is None:
+            raise ValueError(f"Transcription with ID {transcription_id} not found")
+        _cache_content(transcription_id, content)
+    
+    return content, _get_conversation_history(db, transcription_id, limit)
+
+
+def _get_cached_content(transcription_id: int) -> Optional[str]:
+    """
+    Look up a transcription's content in the in-process cache.
+    
+    Args:
+        transcription_id: ID of the transcription
+        
+    Returns:
+        The cached transcription text or None if not cached
+    """
+    with _content_cache_lock:
+        content = _content_cache.get(transcription_id)
+        if content is not None:
+            _content_cache.move_to_end(transcription_id)
+        return content
+
+
+def _cache_content(transcription_id: int, content: str) -> None:
+    """
+    Store a transcription's content in the cache, evicting the least
+    recently used entry when full.
+    
+    Args:
+        transcription_id: ID of the transcription
+        content: The transcription text
+    """
+    with _content_cache_lock:
+        _content_cache[transcription_id] = content
+        _content_cache.move_to_end(transcription_id)
+        if len(_content_cache) > _CONTENT_CACHE_SIZE:
+            _content_cache.popitem(last=False)
+
+
+def invalidate_transcription_content(transcription_id: int) -> None:
+    """
+    Drop a transcription's cached content.
+    
+    Must be called whenever a transcription row is written, since SQLite
+    may hand out the ID of a deleted or rolled-back row again.
+    
+    Args:
+        transcription_id: ID of the transcription
+    """
+    with _content_cache_lock:
+        _content_cache.pop(transcription_id, None)
+
+
+def clear_transcription_content_cache() -> None:
+    """
+    Drop all cached transcription content.
+    
+    Needed when many transcription rows are removed at once, such as a
+    rolled-back transaction, whose IDs SQLite may then hand out again.
+    """
+    with _content_cache_lock:
+        _content_cache.clear()
+
+
+def _recent_messages(transcription_id: int, limit: int) -> Subquery:
+    """
+    Build a subquery selecting the newest messages of a transcription.
+    
+    Args:
+        transcription_id: ID of the transcription
+        limit: Maximum number of messages to select
+        
+    Returns:
+        The subquery; callers order its rows chronologically
+    """
+    # created_at only has second resolution, so the ID breaks ties
+    return (
+        select(ChatMessage)
+        .where(ChatMessage.transcription_id == transcription_id)
+        .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+        .limit(limit)
+        .subquery()
+    )
 
 
 def _get_conversation_history(db: Session, transcription_id: int, limit: int = 10) -> List[ChatMessage]:
@@ -93,38 +211,39 @@ def _get_conversation_history(db: Session, transcription_id: int, limit: int = 1
         limit: Maximum number of messages to return
         
     Returns:
-        List of chat messages
+        The most recent chat messages in chronological order
     """
+    recent = _recent_messages(transcription_id, limit)
+    recent_message = aliased(ChatMessage, recent)
     return (
-        db.query(ChatMessage)
-        .filter(ChatMessage.transcription_id == transcription_id)
-        .order_by(ChatMessage.created_at.desc())
-        .limit(limit)
+        db.execute(select(recent_message).order_by(recent.c.created_at, recent.c.id))
+        .scalars()
         .all()
     )
 
 
-def _save_message(db: Session, transcription_id: int, role: str, content: str) -> ChatMessage:
+def _save_messages(db: Session, rows: List[Dict[str, Any]]) -> List[Row]:
     """
-    Save a chat message to the database.
+    Save chat messages to the database in a single transaction.
+    
+    All rows go through one executemany INSERT ... RETURNING, so neither
+    per-object ORM bookkeeping nor a refresh SELECT is needed.
     
     Args:
         db: Database session
-        transcription_id: ID of the transcription
-        role: Message role ('user' or 'assistant')
-        content: Message content
+        rows: Column values (transcription_id, role, content) per message
         
     Returns:
-        The created message record
+        The generated (id, created_at) of each message, in the order given
     """
-    db_message = ChatMessage(
-        transcription_id=transcription_id,
-        role=role,
-        content=content
-    )
-    db.add(db_message)
+    created = db.execute(
+        insert(ChatMessage).returning(
+            ChatMessage.id, ChatMessage.created_at, sort_by_parameter_order=True
+        ),
+        rows
+    ).all()
     db.commit()
-    return db_message
+    return created
 
 
 def _prepare_messages(
@@ -137,27 +256,22 @@ def _prepare_messages(
     
     Args:
         transcription_content: Content of the transcription
-        conversation_history: Previous messages
+        conversation_history: Previous messages in chronological order
         current_message: Current user message
         
     Returns:
         List of messages formatted for OpenAI API
     """
-    messages = [
-        {
-            "role": "system", 
-            "content": f"You are an assistant helping with questions about a transcribed audio. Here is the transcription: {transcription_content}"
-        }
-    ]
-    
-    # Add previous messages in chronological order
-    for msg in reversed(conversation_history):
-        messages.append({"role": msg.role, "content": msg.content})
-    
-    # Add the current message
-    messages.append({"role": "user", "content": current_message})
-    
-    return messages
+    return (
+        [
+            {
+                "role": "system", 
+                "content": f"You are an assistant helping with questions about a transcribed audio. Here is the transcription: {transcription_content}"
+            }
+        ]
+        + [{"role": msg.role, "content": msg.content} for msg in conversation_history]
+        + [{"role": "user", "content": current_message}]
+    )
 
 
 async def _get_chat_completion(messages: List[Dict[str, str]]) -> str:
@@ -170,14 +284,14 @@ async def _get_chat_completion(messages: List[Dict[str, str]]) -> str:
     Returns:
         The assistant's response
     """
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model="gpt-4o",
         messages=messages
     )
     
     return response.choices[0].message.content 
 
-async def get_chat_history(db: Session, transcription_id: int) -> List[ChatMessageResponse]:
+async def get_chat_history(db: Session, transcription_id: int) -> List[ChatMessage]:
     """
     Retrieves the chat history for a specific transcription.
     
@@ -186,16 +300,30 @@ async def get_chat_history(db: Session, transcription_id: int) -> List[ChatMessa
         transcription_id: ID of the transcription
         
     Returns:
-        List[ChatMessageResponse]: List of chat messages in chronological order
+        List[ChatMessage]: List of chat messages in chronological order
         
     Note:
-        Messages are returned in order of creation (oldest first).
+        Messages are returned in order of creation (oldest first). The ORM
+        records are returned as-is; routes serialize them through their
+        response_model, so they are not validated twice.
     """
-    messages = db.query(ChatMessage).filter(
-        ChatMessage.transcription_id == transcription_id
-    ).order_by(ChatMessage.created_at).all()
+    return await run_in_threadpool(_query_chat_history, db, transcription_id)
+
+
+def _query_chat_history(db: Session, transcription_id: int) -> List[ChatMessage]:
+    """
+    Query all chat messages for a transcription, oldest first.
     
-    return [ChatMessageResponse.from_orm(msg) for msg in messages]
+    Args:
+        db: SQLAlchemy database session
+        transcription_id: ID of the transcription
+        
+    Returns:
+        List[ChatMessage]: Chat messages in chronological order
+    """
+    return db.query(ChatMessage).filter(
+        ChatMessage.transcription_id == transcription_id
+    ).order_by(ChatMessage.created_at, ChatMessage.id).all()
 
 async def create_chat_message(
     db: Session,
@@ -205,10 +333,9 @@ async def create_chat_message(
     Creates a new chat message and generates an AI response.
     
     This function:
-    1. Saves the user's message
-    2. Retrieves the transcription context
-    3. Generates an AI response using GPT-4
-    4. Saves the AI response
+    1. Retrieves the transcription context and chat history
+    2. Generates an AI response using GPT-4
+    3. Saves the user's message and the AI response in one statement
     
     Args:
         db: SQLAlchemy database session
@@ -222,23 +349,13 @@ async def create_chat_message(
     """
     try:
         # Get transcription for context
-        transcription = db.query(Transcription).filter(
-            Transcription.id == message.transcription_id
-        ).first()
+        transcription = await run_in_threadpool(
+            _find_transcription, db, message.transcription_id
+        )
         
         if not transcription:
             raise Exception("Transcription not found")
         
-        # Create user message
-        user_message = ChatMessage(
-            transcription_id=message.transcription_id,
-            role="user",
-            content=message.content
-        )
-        db.add(user_message)
-        db.commit()
-        db.refresh(user_message)
-        
         # Get chat history for context
         history = await get_chat_history(db, message.transcription_id)
         
@@ -247,27 +364,25 @@ async def create_chat_message(
             {"role": "system", "content": f"You are a helpful assistant analyzing the following transcription:\n\n{transcription.content}"}
         ]
         
-        # Add chat history
+        # Add chat history followed by the current message
         for msg in history:
             messages.append({"role": msg.role, "content": msg.content})
+        messages.append({"role": "user", "content": message.content})
         
         # Generate AI response
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4",
             messages=messages
         )
         
-        # Create assistant message
-        assistant_message = ChatMessage(
-            transcription_id=message.transcription_id,
-            role="assistant",
-            content=response.choices[0].message.content
-        )
-        db.add(assistant_message)
-        db.commit()
-        db.refresh(assistant_message)
+        # Persist the user and assistant messages together
+        rows = [
+            {"transcription_id": message.transcription_id, "role": "user", "content": message.content},
+            {"transcription_id": message.transcription_id, "role": "assistant", "content": response.choices[0].message.content},
+        ]
+        created = await run_in_threadpool(_save_messages, db, rows)
         
-        return ChatMessageResponse.from_orm(assistant_message)
+        return ChatMessageResponse(**rows[1], id=created[1].id, created_at=created[1].created_at)
         
     except Exception as e:
         logger.error(f"Error creating chat message: {str(e)}")
@@ -284,8 +399,24 @@ async def get_transcription_context(db: Session, transcription_id: int) -> Optio
     Returns:
         Optional[str]: The transcription content or None if not found
     """
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = await run_in_threadpool(_find_transcription, db, transcription_id)
+    
+    return transcription.content if transcription else None
+
+
+def _find_transcription(db: Session, transcription_id: int) -> Optional[Transcription]:
+    """
+    Look up a transcription by ID.
     
-    return transcription.content if transcription else None 
\ No newline at end of file
+    Args:
+        db: SQLAlchemy database session
+        transcription_id: ID of the transcription
+        
+    Returns:
+        Optional[Transcription]: The transcription record or None if not found
+        
+    Note:
+        Uses a primary-key lookup, which is answered from the session's
+        identity map when the record is already loaded.
+    """
+    return db.get(Transcription, transcription_id) 
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+Retrieval Service Module
+
+This module keeps chat prompts small for long transcriptions. Instead of
+sending the whole transcription with every chat turn, long transcriptions
+are split into chunks that are embedded once, and each turn only includes
+the chunks most similar to the user's message.
+
+Key components:
+- Transcription chunking
+- OpenAI embeddings integration
+- Similarity ranking with NumPy
+"""
+
+import os
+import numpy as np
+import openai
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import List, Tuple
+import logging
+
+from app.models.models import TranscriptionChunk
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Initialize OpenAI client with API key from environment
+client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Roughly 500 tokens at ~4 characters per token
+CHUNK_SIZE = 2000
+
+# Number of chunks included in the prompt
+TOP_K = 5
+
+# Inputs sent per embeddings request when indexing
+_EMBEDDING_BATCH_SIZE = 100
+
+# Transcriptions up to this length are sent whole; the top chunks would
+# cover most of them anyway
+_MIN_INDEXED_LENGTH = CHUNK_SIZE * TOP_K
+
+
+async def index_transcription(db: Session, transcription_id: int, content: str) -> None:
+    """
+    Split a long transcription into chunks and store their embeddings.
+    
+    Short transcriptions are not indexed. Failures are logged and not
+    raised: without chunks, chats fall back to the full transcription.
+    
+    Args:
+        db: Database session
+        transcription_id: ID of the transcription
+        content: Transcription text
+    """
+    if len(content) <= _MIN_INDEXED_LENGTH:
+        return
+    
+    try:
+        spans = _split_into_chunks(content)
+        texts = [content[start:end] for start, end in spans]
+        embeddings: List[List[float]] = []
+        for i in range(0, len(texts), _EMBEDDING_BATCH_SIZE):
+            embeddings.extend(await _embed(texts[i:i + _EMBEDDING_BATCH_SIZE]))
+        
+        chunks = [
+            TranscriptionChunk(
+                transcription_id=transcription_id,
+                position=position,
+                start=start,
+                end=end,
+                embedding=np.asarray(embedding, dtype=np.float32).tobytes()
+            )
+            for position, ((start, end), embedding) in enumerate(zip(spans, embeddings))
+        ]
+        await run_in_threadpool(_save_chunks, db, chunks)
+    
+    except Exception as e:
+        logger.error(f"Error indexing transcription {transcription_id}: {str(e)}")
+
+
+async def select_relevant_content(
+    db: Session, 
+    transcription_id: int, 
+    content: str, 
+    query: str
+) -> str:
+    """
+    Get the parts of a transcription most relevant to a chat message.
+    
+    Args:
+        db: Database session
+        transcription_id: ID of the transcription
+        content: Full transcription text
+        query: The user's message
+        
+    Returns:
+        The top chunks in transcript order, or the full content for short
+        or unindexed transcriptions
+    """
+    if len(content) <= _MIN_INDEXED_LENGTH:
+        return content
+    
+    chunks = await run_in_threadpool(_load_chunks, db, transcription_id)
+    if not chunks:
+        return content
+    
+    try:
+        query_vector = np.asarray((await _embed([query]))[0], dtype=np.float32)
+    except Exception as e:
+        logger.error(f"Error embedding chat message: {str(e)}")
+        return content
+    
+    vectors = np.vstack([np.frombuffer(chunk.embedding, dtype=np.float32) for chunk in chunks])
+    scores = (vectors @ query_vector) / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vector))
+    
+    top = np.argpartition(-scores, TOP_K - 1)[:TOP_K] if len(chunks) > TOP_K else range(len(chunks))
+    selected = sorted(chunks[i] for i in top)
+    return "\n...\n".join(content[start:end].strip() for _, start, end, _ in selected)
+
+
+def _split_into_chunks(content: str) -> List[Tuple[int, int]]:
+    """
+    Split text into spans of about CHUNK_SIZE characters.
+    
+    Spans end at whitespace where possible so words are not cut.
+    
+    Args:
+        content: Text to split
+        
+    Returns:
+        List of (start, end) offsets covering the whole text
+    """
+    spans = []
+    start = 0
+    while start < len(content):
+        end = min(start + CHUNK_SIZE, len(content))
+        if end < len(content):
+            split = content.rfind(" ", start + CHUNK_SIZE // 2, end)
+            if split != -1:
+                end = split + 1
+        spans.append((start, end))
+        start = end
+    return spans
+
+
+async def _embed(texts: List[str]) -> List[List[float]]:
+    """
+    Get embeddings from OpenAI API.
+    
+    Args:
+        texts: Texts to embed
+        
+    Returns:
+        One embedding vector per input text, in input order
+    """
+    response = await client.embeddings.create(model=EMBEDDING_MODEL, input=texts)
+    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+def _save_chunks(db: Session, chunks: List[TranscriptionChunk]) -> None:
+    """
+    Save transcription chunks to the database in one transaction.
+    
+    Args:
+        db: Database session
+        chunks: Chunk records to save
+    """
+    db.add_all(chunks)
+    db.commit()
+
+
+def _load_chunks(db: Session, transcription_id: int) -> List[Tuple[int, int, int, bytes]]:
+    """
+    Load the stored chunks of a transcription.
+    
+    Args:
+        db: Database session
+        transcription_id: ID of the transcription
+        
+    Returns:
+        (position, start, end, embedding) rows ordered by position
+    """
+    return (
+        db.query(TranscriptionChunk)
+        .with_entities(
+            TranscriptionChunk.position,
+            TranscriptionChunk.start,
+            TranscriptionChunk.end,
+            TranscriptionChunk.embedding
+        )
+        .filter(TranscriptionChunk.transcription_id == transcription_id)
+        .order_by(TranscriptionChunk.position)
+        .all()
+    )
@@ -7,32 +7,29 @@ It provides functions for processing audio files and managing transcriptions.
 Key components:
 - Audio file processing
 - OpenAI API integration
-- Temporary file management
 - Error handling
 """
 
+import io
 import os
-import tempfile
 import openai
 from fastapi import UploadFile
-from typing import Optional, Union
+from typing import Union
 import logging
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Initialize OpenAI client with API key from environment
-client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 async def transcribe_audio(file: UploadFile) -> str:
     """
     Transcribes an audio file using OpenAI's GPT-4o-transcribe API.
     
     This function handles the complete transcription process:
-    1. Creates a temporary file for the uploaded audio
-    2. Sends the file to OpenAI for transcription
-    3. Cleans up temporary files
-    4. Returns the transcribed text
+    1. Sends the uploaded file to OpenAI for transcription
+    2. Returns the transcribed text
     
     Args:
         file: The uploaded audio file (FastAPI UploadFile)
@@ -44,37 +41,19 @@ async def transcribe_audio(file: UploadFile) -> str:
         Exception: If transcription fails or file processing errors occur
         
     Note:
-        The function uses temporary files to handle the audio data.
-        These files are automatically cleaned up after processing.
+        The upload's underlying file object is passed to the OpenAI client
+        as a (filename, file, content_type) tuple, so the audio is not
+        copied to a temporary file first.
     """
-    temp_file_path: Optional[str] = None
     try:
-        # Create a temporary file to store the uploaded content
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-            # Read content from the uploaded file and write to the temp file
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        # Rewind the uploaded file for potential reuse
-        await file.seek(0)
-        
-        # Open the temporary file and send to OpenAI
-        with open(temp_file_path, "rb") as audio_file:
-            transcription = client.audio.transcriptions.create(
-                model="gpt-4o-transcribe",
-                file=audio_file
-            )
-        
-        # Clean up the temporary file
-        os.unlink(temp_file_path)
+        transcription = await client.audio.transcriptions.create(
+            model="gpt-4o-transcribe",
+            file=(file.filename, file.file, file.content_type)
+        )
         
         return transcription.text
     
     except Exception as e:
-        # Clean up temp file if it exists and there was an error
-        if temp_file_path:
-            os.unlink(temp_file_path)
         logger.error(f"Error transcribing audio: {str(e)}")
         raise Exception(f"Error transcribing audio: {str(e)}")
 
@@ -88,7 +67,7 @@ async def transcribe_audio_data(audio_data: bytes, file_extension: str = ".webm"
     
     Args:
         audio_data: Raw audio data in bytes
-        file_extension: The file extension to use for the temporary file
+        file_extension: The file extension used to name the audio for OpenAI
         
     Returns:
         str: The transcribed text
@@ -97,31 +76,18 @@ async def transcribe_audio_data(audio_data: bytes, file_extension: str = ".webm"
         Exception: If transcription fails or data processing errors occur
         
     Note:
-        The function creates a temporary file with the specified extension
-        to handle the audio data. This file is cleaned up after processing.
+        The audio is sent from memory; the file extension only determines
+        the filename and content type OpenAI uses to detect the format.
     """
-    temp_file_path: Optional[str] = None
     try:
-        # Create a temporary file to store the audio data
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-            temp_file.write(audio_data)
-            temp_file_path = temp_file.name
-        
-        # Open the temporary file and send to OpenAI
-        with open(temp_file_path, "rb") as audio_file:
-            transcription = client.audio.transcriptions.create(
-                model="gpt-4o-transcribe",
-                file=audio_file
-            )
-        
-        # Clean up the temporary file
-        os.unlink(temp_file_path)
+        audio_format = file_extension.lstrip(".")
+        transcription = await client.audio.transcriptions.create(
+            model="gpt-4o-transcribe",
+            file=(f"audio{file_extension}", io.BytesIO(audio_data), f"audio/{audio_format}")
+        )
         
         return transcription.text
     
     except Exception as e:
-        # Clean up temp file if it exists and there was an error
-        if temp_file_path:
-            os.unlink(temp_file_path)
         logger.error(f"Error transcribing audio data: {str(e)}")
-        raise Exception(f"Error transcribing audio data: {str(e)}") 
\ No newline at end of file
+        raise Exception(f"Error transcribing audio data: {str(e)}")
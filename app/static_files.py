@@ -0,0 +1,76 @@
+"""
+Static Files Module
+
+This module serves the frontend's static files with HTTP caching headers.
+
+Key components:
+- Long-lived, immutable caching for Next.js build assets
+- Revalidation (ETag/Last-Modified) for everything else
+- Optional memoization of file lookups
+"""
+
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+from starlette.responses import Response
+from starlette.staticfiles import PathLike, StaticFiles
+from starlette.types import Scope
+
+# Next.js keeps its content-hashed build assets under _next/static/. Other
+# files are matched by name only, and a digit run such as a date in
+# report-20241015.pdf cannot be told apart from a hash, so they are never
+# treated as immutable
+_HASHED_ASSET = re.compile(r"(^|/)_next/static/")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that sets Cache-Control and can memoize file lookups.
+    
+    Next.js build assets never change under the same name, so browsers and
+    CDNs may cache them for a year without revalidating. Other files, such as
+    index.html, are revalidated using the ETag set by FileResponse.
+    
+    Args:
+        cache_lookups: Remember resolved paths and their stat results
+            instead of hitting the filesystem on every request. Only
+            suitable when the files do not change while the app runs.
+        **kwargs: Passed to StaticFiles
+    """
+    
+    def __init__(self, *, cache_lookups: bool = False, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cache_lookups = cache_lookups
+        self._lookup_cache: Dict[str, Tuple[str, os.stat_result]] = {}
+    
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        if not self.cache_lookups:
+            return super().lookup_path(path)
+        
+        cached = self._lookup_cache.get(path)
+        if cached is not None:
+            return cached
+        
+        full_path, stat_result = super().lookup_path(path)
+        # Misses are not cached so the cache cannot grow from arbitrary URLs
+        if stat_result is not None:
+            self._lookup_cache[path] = (full_path, stat_result)
+        return full_path, stat_result
+    
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if status_code == 200 and _HASHED_ASSET.search(scope["path"]):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response
@@ -1,66 +1,213 @@
+import io
+import os
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import configure_mappers, scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.db import database
 from app.db.database import Base, get_db
 from app.main import app
 from app.models.models import Transcription, ChatMessage  # Import models to ensure they are registered
-from unittest.mock import patch, MagicMock
+from app.services import chat_service, retrieval_service, transcription_service
+from types import SimpleNamespace
 
-# Test database URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Generate the OpenAPI schema (and the Pydantic schemas behind it) once when
+# the test process starts; under pytest-xdist this happens once per worker
+app.openapi()
 
-# Create test database engine
+# The tests bring their own schema; keep app startup from creating tables in
+# the application database
+os.environ["RUN_MIGRATIONS_ON_STARTUP"] = "0"
+
+# Test database URL; in-memory, so tests never touch the disk
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+
+# Create test database engine. An in-memory database lives only as long as
+# its connection, so StaticPool shares a single connection across the
+# test session and the app's worker threads.
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+
+# pysqlite defers BEGIN until the first write and so mishandles SAVEPOINTs;
+# take over transaction control so the outer test transaction really begins
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _begin_transaction(connection):
+    connection.exec_driver_sql("BEGIN")
+
+# Test data is disposable, so skip durability bookkeeping entirely
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.close()
+
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 @pytest.fixture(scope="session", autouse=True)
 def db_engine():
     """Create all tables in the test database."""
-    Base.metadata.drop_all(bind=engine)  # Clean up any existing tables
-    Base.metadata.create_all(bind=engine)  # Create fresh tables
+    # The in-memory database starts empty and vanishes with its connection,
+    # so there is nothing to drop before or after the run
+    Base.metadata.create_all(bind=engine)
+    # Configure mappers and initialize the dialect once, up front, instead
+    # of lazily inside the first test that needs them
+    configure_mappers()
+    with engine.connect():
+        pass
     yield engine
-    Base.metadata.drop_all(bind=engine)  # Clean up after all tests
+    engine.dispose()
 
-@pytest.fixture(scope="function")
-def db_session(db_engine):
-    """Create a fresh database session for each test."""
+@pytest.fixture(scope="session")
+def db_connection(db_engine):
+    """Open the connection all tests run on."""
     connection = db_engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    yield connection
+    connection.close()
+
+@pytest.fixture(scope="function")
+def db_session(db_connection):
+    """
+    Create a fresh database session for each test.
+    
+    The session runs inside a SAVEPOINT of an outer transaction that is
+    rolled back after the test. Commits and rollbacks made by the code under
+    test only end the SAVEPOINT, and a new one is started for the next
+    unit of work, so nothing leaks into other tests.
+    """
+    transaction = db_connection.begin()
+    session = TestingSessionLocal(bind=db_connection, join_transaction_mode="create_savepoint")
     
     yield session
     
     session.close()
     transaction.rollback()
-    connection.close()
 
 @pytest.fixture
+def read_sessions(db_session, db_connection, monkeypatch):
+    """
+    Serve read_session() from thread-local sessions on the test's connection.
+    
+    The real read_session() and get_read_session() stay in place; only the
+    scoped_session behind them is swapped. Each read session joins the
+    test's transaction through its own SAVEPOINT, so it sees the rows
+    db_session has flushed and cannot change them.
+    """
+    sessions = scoped_session(sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=db_connection,
+        join_transaction_mode="create_savepoint"
+    ))
+    monkeypatch.setattr(database, "ScopedSession", sessions)
+    yield sessions
+    sessions.remove()
+
+@pytest.fixture(autouse=True)
+def clear_content_cache():
+    """Drop cached transcription content once the test's rows are rolled back."""
+    yield
+    # SQLite reuses the rolled-back IDs, so cached content would leak into
+    # the next test's transcriptions
+    chat_service.clear_transcription_content_cache()
+
+@pytest.fixture
+def sample_transcription(db_session):
+    """Create a transcription within the test's transaction."""
+    transcription = Transcription(
+        filename="test.mp3",
+        content="Test transcription content"
+    )
+    db_session.add(transcription)
+    db_session.flush()
+    return transcription
+
+@pytest.fixture(scope="module")
+def audio_upload():
+    """Factory for the multipart payload of a test audio upload."""
+    data = b"test audio content"
+    return lambda: {"file": ("test.mp3", io.BytesIO(data), "audio/mpeg")}
+
+class StubOpenAIClient:
+    """Stand-in for openai.AsyncOpenAI returning canned responses."""
+    
+    transcription = SimpleNamespace(text="This is a test transcription.")
+    completion = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="This is a test answer."))]
+    )
+    
+    def __init__(self):
+        self.audio = SimpleNamespace(transcriptions=SimpleNamespace(create=self._create_transcription))
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create_completion))
+        self.embeddings = SimpleNamespace(create=self._create_embeddings)
+    
+    async def _create_transcription(self, **kwargs):
+        return self.transcription
+    
+    async def _create_completion(self, **kwargs):
+        return self.completion
+    
+    async def _create_embeddings(self, input, **kwargs):
+        # Letter frequencies stand in for embeddings: texts sharing letters
+        # score as similar, which is enough to exercise the ranking
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=self.embed(text))
+            for i, text in enumerate(input)
+        ])
+    
+    @staticmethod
+    def embed(text):
+        text = text.lower()
+        return [float(text.count(letter)) for letter in "abcdefghijklmnopqrstuvwxyz"]
+    
+    async def close(self):
+        pass
+
+@pytest.fixture(scope="session", autouse=True)
 def mock_openai():
-    """Mock OpenAI client for testing."""
-    mock_response = MagicMock()
-    mock_response.text = "This is a test transcription."
+    """Replace the services' OpenAI clients with a stub for the whole test session."""
+    stub = StubOpenAIClient()
+    services = (chat_service, retrieval_service, transcription_service)
+    originals = [service.client for service in services]
+    for service in services:
+        service.client = stub
     
-    mock_client = MagicMock()
-    mock_client.audio.transcriptions.create.return_value = mock_response
+    yield stub
     
-    with patch('app.services.transcription_service.client', mock_client):
-        yield mock_client
+    for service, original in zip(services, originals):
+        service.client = original
+
+@pytest.fixture(scope="session")
+def test_client(mock_openai):
+    """Test client shared by all tests, so app startup runs once."""
+    with TestClient(app) as test_client:
+        # Send one request through the full stack up front so first-request
+        # setup (portal, routing, JSON response rendering) is not timed
+        # inside whichever test happens to run first
+        test_client.get("/api")
+        yield test_client
 
 @pytest.fixture
-def client(db_engine, db_session, mock_openai):
-    """Test client fixture."""
+def client(db_session, read_sessions, test_client):
+    """Test client fixture serving requests from the test's database session."""
+    # db_session is closed by its own fixture
     def override_get_db():
-        try:
-            yield db_session
-        finally:
-            db_session.close()
+        yield db_session
             
     app.dependency_overrides[get_db] = override_get_db
     
-    with TestClient(app) as test_client:
-        yield test_client
+    yield test_client
         
     app.dependency_overrides.clear() 
\ No newline at end of file
@@ -1,6 +1,8 @@
+import pydantic
 import pytest
 from fastapi.testclient import TestClient
-import io
+
+from app.models.schemas import ChatRequest
 
 def test_api_root(client):
     """Test the root API endpoint."""
@@ -8,7 +10,7 @@ def test_api_root(client):
     assert response.status_code == 200
     assert response.json() == {"message": "Welcome to Audio Transcription and Chat API"}
 
-def test_transcription_endpoints(client, db_session):
+def test_transcription_endpoints(client, db_session, audio_upload):
     """Test transcription endpoints."""
     # Test GET transcriptions (empty list initially)
     response = client.get("/api/v1/transcriptions/")
@@ -17,55 +19,136 @@ def test_transcription_endpoints(client, db_session):
     assert len(response.json()) == 0
 
     # Test POST transcription (mock file upload)
-    test_file = io.BytesIO(b"test audio content")
-    files = {"file": ("test.mp3", test_file, "audio/mpeg")}
-    response = client.post("/api/v1/transcriptions/", files=files)
-    assert response.status_code in [200, 422]  # 422 if file validation fails
-
-    if response.status_code == 200:
-        data = response.json()
-        assert "id" in data
-        assert data["filename"] == "test.mp3"
-        assert "content" in data
-        assert "created_at" in data
-
-def test_chat_endpoints(client, db_session):
+    response = client.post("/api/v1/transcriptions/", files=audio_upload())
+    assert response.status_code == 200
+    data = response.json()
+    assert "id" in data
+    assert data["filename"] == "test.mp3"
+    assert "content" in data
+    assert "created_at" in data
+
+def test_get_transcription(client, sample_transcription):
+    """A transcription is fetched by ID with its content."""
+    response = client.get(f"/api/v1/transcriptions/{sample_transcription.id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == sample_transcription.id
+    assert data["filename"] == "test.mp3"
+    assert data["content"] == "Test transcription content"
+
+def test_get_missing_transcription(client):
+    """An unknown transcription ID answers 404."""
+    response = client.get("/api/v1/transcriptions/999")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Transcription not found"}
+
+def test_chat_endpoints(client, sample_transcription):
     """Test chat endpoints."""
-    # First create a transcription
-    test_file = io.BytesIO(b"test audio content")
-    files = {"file": ("test.mp3", test_file, "audio/mpeg")}
-    response = client.post("/api/v1/transcriptions/", files=files)
-    
-    if response.status_code == 200:
-        transcription_id = response.json()["id"]
-        
-        # Test GET chat history (empty initially)
-        response = client.get(f"/api/v1/chat/history/{transcription_id}")
-        assert response.status_code == 200
-        assert isinstance(response.json(), list)
-        assert len(response.json()) == 0
-
-        # Test POST chat message
-        test_message = {
-            "transcription_id": transcription_id,
-            "message": "Test message"
-        }
-        response = client.post("/api/v1/chat/", json=test_message)
-        assert response.status_code in [200, 404]  # 404 if transcription not found
-        
-        if response.status_code == 200:
-            data = response.json()
-            assert "answer" in data
-
-def test_error_handling(client):
+    # The upload path is covered above; seed the transcription directly
+    transcription_id = sample_transcription.id
+
+    # Test GET chat history (empty initially)
+    response = client.get(f"/api/v1/chat/history/{transcription_id}")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+    assert len(response.json()) == 0
+
+    # Test POST chat message
+    test_message = {
+        "transcription_id": transcription_id,
+        "message": "Test message"
+    }
+    response = client.post("/api/v1/chat/", json=test_message)
+    assert response.status_code == 200
+    assert "answer" in response.json()
+
+def test_error_handling(test_client):
     """Test error handling."""
-    # Test invalid endpoint
-    response = client.get("/invalid-endpoint")
+    # Test invalid endpoint; this goes through the whole app, including the
+    # frontend mount when one is served
+    response = test_client.get("/invalid-endpoint")
     assert response.status_code == 404
 
-    # Test invalid chat message format
-    invalid_message = {
-        "message": ""  # Empty message
+    # Test invalid chat message format; the route would answer 422
+    with pytest.raises(pydantic.ValidationError):
+        ChatRequest.model_validate({"transcription_id": 1, "message": ""}) 
+
+@pytest.mark.parametrize("audio_data", [123, None, ["a"]])
+def test_real_time_rejects_non_string_audio(client, audio_data):
+    """Non-string audio data is a validation error, not a server error."""
+    response = client.post("/api/v1/transcriptions/real-time", json={"audio_data": audio_data})
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["body", "audio_data"]
+
+def test_real_time_rejects_invalid_base64(client):
+    """Malformed base64 audio data is reported against the field."""
+    response = client.post("/api/v1/transcriptions/real-time", json={"audio_data": "abc"})
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["body", "audio_data"]
+    assert "base64" in error["msg"]
+
+def test_real_time_transcription(client):
+    """Valid base64 audio data is decoded and transcribed."""
+    response = client.post("/api/v1/transcriptions/real-time", json={"audio_data": "dGVzdA=="})
+    assert response.status_code == 200
+    assert response.json() == {
+        "transcription": "This is a test transcription.",
+        "transcription_id": None
     }
-    response = client.post("/api/v1/chat/", json=invalid_message)
-    assert response.status_code == 422  # Validation error 
\ No newline at end of file
+
+def test_real_time_openapi_schema(test_client):
+    """The published schema describes audio data as a base64 string."""
+    schema = test_client.get("/openapi.json").json()
+    body = schema["paths"]["/api/v1/transcriptions/real-time"]["post"]["requestBody"]
+    audio_data = body["content"]["application/json"]["schema"]["properties"]["audio_data"]
+    assert audio_data["type"] == "string"
+    assert audio_data["contentEncoding"] == "base64"
+    assert "format" not in audio_data
+
+def test_chat_rejects_invalid_json(client):
+    """A body that is not JSON is a 422 located at the body itself."""
+    response = client.post(
+        "/api/v1/chat/",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["type"] == "json_invalid"
+    assert error["loc"][0] == "body"
+
+def test_chat_rejects_wrong_field_type(client):
+    """Field errors are located under the request body."""
+    response = client.post(
+        "/api/v1/chat/",
+        json={"transcription_id": "abc", "message": "Test message"}
+    )
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["body", "transcription_id"]
+
+def test_list_transcriptions_paging(client, db_session):
+    """Listings are paged newest first and leave out the content."""
+    for i in range(5):
+        client.post(
+            "/api/v1/transcriptions/",
+            files={"file": (f"test{i}.mp3", b"test audio content", "audio/mpeg")}
+        )
+
+    response = client.get("/api/v1/transcriptions/", params={"limit": 2})
+    assert response.status_code == 200
+    first_page = response.json()
+    assert [entry["filename"] for entry in first_page] == ["test4.mp3", "test3.mp3"]
+    assert all(set(entry) == {"id", "filename", "created_at"} for entry in first_page)
+
+    response = client.get(
+        "/api/v1/transcriptions/",
+        params={"limit": 2, "before_id": first_page[-1]["id"]}
+    )
+    assert response.status_code == 200
+    assert [entry["filename"] for entry in response.json()] == ["test2.mp3", "test1.mp3"]
+
+    response = client.get("/api/v1/transcriptions/", params={"limit": 0})
+    assert response.status_code == 422
@@ -0,0 +1,35 @@
+import pytest
+import zlib
+from sqlalchemy.orm import Session
+from app.models.models import Transcription, ChatMessage
+from app.services.chat_service import _get_chat_context
+
+def test_chat_context_decompresses_content_once(db_session: Session, monkeypatch):
+    """A cache miss decompresses the content once, however long the history."""
+    content = "A long transcription. " * 200
+    transcription = Transcription(filename="long.mp3", content=content)
+    db_session.add(transcription)
+    db_session.flush()
+    db_session.add_all([
+        ChatMessage(transcription_id=transcription.id, role="user", content=f"Message {i}")
+        for i in range(10)
+    ])
+    db_session.flush()
+
+    calls = []
+    decompress = zlib.decompress
+    monkeypatch.setattr(zlib, "decompress", lambda data: calls.append(data) or decompress(data))
+
+    loaded, history = _get_chat_context(db_session, transcription.id)
+    assert loaded == content
+    assert [message.content for message in history] == [f"Message {i}" for i in range(10)]
+    assert len(calls) == 1
+
+    # Later turns are served from the content cache
+    _get_chat_context(db_session, transcription.id)
+    assert len(calls) == 1
+
+def test_chat_context_missing_transcription(db_session: Session):
+    """An unknown transcription ID is reported as a ValueError."""
+    with pytest.raises(ValueError):
+        _get_chat_context(db_session, 999)
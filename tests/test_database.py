@@ -0,0 +1,48 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import inspect
+from app.db.database import get_read_session, read_session
+from app.models.models import Transcription
+
+def test_get_read_session_returns_factory():
+    """The dependency hands out the factory, not an open session."""
+    assert get_read_session() is read_session
+
+def test_read_session_reuses_thread_session(read_sessions):
+    """Reads on one thread reuse the same registered session."""
+    with read_session() as first:
+        pass
+    with read_session() as second:
+        pass
+    assert first is second
+
+def test_read_session_per_thread(read_sessions):
+    """Each thread gets its own session."""
+    def open_session():
+        with read_session() as session:
+            return session
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(open_session).result()
+    assert open_session() is not other
+
+def test_read_session_closes_on_exit(read_sessions, sample_transcription):
+    """Leaving the block ends the transaction and detaches loaded objects."""
+    with read_session() as session:
+        transcription = session.get(Transcription, sample_transcription.id)
+        assert session.in_transaction()
+        assert transcription is not sample_transcription
+
+    assert not session.in_transaction()
+    assert inspect(transcription).detached
+    # Attributes loaded inside the block stay readable after it
+    assert transcription.content == "Test transcription content"
+
+def test_read_session_closes_on_error(read_sessions, sample_transcription):
+    """The session is closed even when the block raises."""
+    with pytest.raises(RuntimeError):
+        with read_session() as session:
+            session.get(Transcription, sample_transcription.id)
+            raise RuntimeError("boom")
+    assert not session.in_transaction()
+    assert len(session.identity_map) == 0
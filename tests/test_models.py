@@ -1,6 +1,8 @@
 import pytest
-from sqlalchemy.orm import Session
-from app.models.models import Transcription, ChatMessage
+import zlib
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, selectinload
+from app.models.models import CompressedText, Transcription, ChatMessage
 
 def test_create_transcription(db_session: Session):
     """Test creating a transcription record."""
@@ -10,46 +12,30 @@ def test_create_transcription(db_session: Session):
     )
     db_session.add(transcription)
     db_session.commit()
-    db_session.refresh(transcription)
 
     assert transcription.id is not None
     assert transcription.filename == "test.mp3"
     assert transcription.content == "Test transcription content"
 
-def test_create_chat_message(db_session: Session):
+def test_create_chat_message(db_session: Session, sample_transcription: Transcription):
     """Test creating a chat message."""
-    # First create a transcription
-    transcription = Transcription(
-        filename="test.mp3",
-        content="Test transcription content"
-    )
-    db_session.add(transcription)
-    db_session.commit()
-
     # Create a chat message
     chat_message = ChatMessage(
-        transcription_id=transcription.id,
+        transcription_id=sample_transcription.id,
         role="user",
         content="Test chat message"
     )
     db_session.add(chat_message)
     db_session.commit()
-    db_session.refresh(chat_message)
 
     assert chat_message.id is not None
-    assert chat_message.transcription_id == transcription.id
+    assert chat_message.transcription_id == sample_transcription.id
     assert chat_message.role == "user"
     assert chat_message.content == "Test chat message"
 
-def test_transcription_chat_relationship(db_session: Session):
+def test_transcription_chat_relationship(db_session: Session, sample_transcription: Transcription):
     """Test the relationship between Transcription and ChatMessage."""
-    # Create a transcription
-    transcription = Transcription(
-        filename="test.mp3",
-        content="Test transcription content"
-    )
-    db_session.add(transcription)
-    db_session.commit()
+    transcription = sample_transcription
 
     # Create multiple chat messages
     messages = [
@@ -60,10 +46,59 @@ def test_transcription_chat_relationship(db_session: Session):
         )
         for i in range(3)
     ]
-    for message in messages:
-        db_session.add(message)
+    db_session.bulk_save_objects(messages)
     db_session.commit()
 
-    # Test the relationship
-    assert len(transcription.messages) == 3
-    assert all(msg.transcription_id == transcription.id for msg in transcription.messages) 
\ No newline at end of file
+    # Test the relationship, loading the messages in a single SELECT
+    loaded = db_session.scalar(
+        select(Transcription)
+        .options(selectinload(Transcription.messages))
+        .where(Transcription.id == transcription.id)
+    )
+    assert len(loaded.messages) == 3
+    assert all(msg.transcription_id == transcription.id for msg in loaded.messages) 
+
+def _stored_content(db_session: Session, transcription_id: int):
+    """Read a transcription's content column as stored, bypassing the type."""
+    return db_session.execute(
+        text("SELECT content FROM transcriptions WHERE id = :id"), {"id": transcription_id}
+    ).scalar_one()
+
+def _loaded_content(db_session: Session, transcription_id: int) -> str:
+    """Read a transcription's content back through the column type."""
+    return db_session.scalar(
+        select(Transcription.content).where(Transcription.id == transcription_id)
+    )
+
+def test_compressed_text_short_value(db_session: Session):
+    """Values below min_size are stored raw behind a marker byte."""
+    content = "Short transcription"
+    transcription = Transcription(filename="short.mp3", content=content)
+    db_session.add(transcription)
+    db_session.flush()
+
+    assert _stored_content(db_session, transcription.id) == CompressedText._RAW + content.encode("utf-8")
+    assert _loaded_content(db_session, transcription.id) == content
+
+def test_compressed_text_long_value(db_session: Session):
+    """Values of min_size or more are stored zlib-compressed."""
+    content = "A long transcription with ünïcode. " * 200
+    transcription = Transcription(filename="long.mp3", content=content)
+    db_session.add(transcription)
+    db_session.flush()
+
+    stored = _stored_content(db_session, transcription.id)
+    assert stored[:1] == CompressedText._ZLIB
+    assert zlib.decompress(stored[1:]).decode("utf-8") == content
+    assert len(stored) < len(content)
+    assert _loaded_content(db_session, transcription.id) == content
+
+def test_compressed_text_legacy_value(db_session: Session):
+    """Plain text rows written before compression are read back unchanged."""
+    db_session.execute(
+        text("INSERT INTO transcriptions (filename, content) VALUES ('legacy.mp3', 'Legacy content')")
+    )
+    transcription_id = db_session.execute(text("SELECT last_insert_rowid()")).scalar_one()
+
+    assert _stored_content(db_session, transcription_id) == "Legacy content"
+    assert _loaded_content(db_session, transcription_id) == "Legacy content"
@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.models.models import TranscriptionChunk
+from app.services.retrieval_service import (
+    CHUNK_SIZE,
+    _split_into_chunks,
+    index_transcription,
+    select_relevant_content,
+)
+
+def _block(word: str) -> str:
+    """Build exactly one chunk's worth of text out of a 4-letter word."""
+    return f"{word} " * (CHUNK_SIZE // 5)
+
+# 15 chunks; only the "z" chunks resemble the query, with decreasing
+# similarity from the first to the last of them
+_RELEVANT = {1: "zzzz", 4: "zzzb", 7: "zzbb", 10: "zbbb", 13: "zccc"}
+_LONG_CONTENT = "".join(_block(_RELEVANT.get(i, "aaaa")) for i in range(15))
+
+def test_split_into_chunks_on_word_boundaries():
+    """Chunks cover the whole text and end between words."""
+    content = " ".join(f"word{i}" for i in range(2000))
+    spans = _split_into_chunks(content)
+
+    assert spans[0][0] == 0
+    assert spans[-1][1] == len(content)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(spans, spans[1:]))
+    assert all(end - start <= CHUNK_SIZE for start, end in spans)
+    assert all(content[end - 1] == " " for _, end in spans[:-1])
+
+def test_split_into_chunks_without_whitespace():
+    """Text without spaces is cut at the chunk size."""
+    content = "x" * (CHUNK_SIZE * 2 + 10)
+    assert _split_into_chunks(content) == [
+        (0, CHUNK_SIZE),
+        (CHUNK_SIZE, CHUNK_SIZE * 2),
+        (CHUNK_SIZE * 2, CHUNK_SIZE * 2 + 10),
+    ]
+
+async def test_index_skips_short_transcriptions(db_session: Session, sample_transcription):
+    """Short transcriptions are sent whole and get no chunks."""
+    await index_transcription(db_session, sample_transcription.id, sample_transcription.content)
+    assert db_session.query(TranscriptionChunk).count() == 0
+
+async def test_select_relevant_content_top_chunks(db_session: Session, sample_transcription):
+    """The most similar chunks are returned in transcript order."""
+    await index_transcription(db_session, sample_transcription.id, _LONG_CONTENT)
+    assert db_session.query(TranscriptionChunk).count() == 15
+
+    selected = await select_relevant_content(
+        db_session, sample_transcription.id, _LONG_CONTENT, "zzzz"
+    )
+    assert selected == "\n...\n".join(
+        _block(word).strip() for _, word in sorted(_RELEVANT.items())
+    )
+
+async def test_select_relevant_content_without_chunks(db_session: Session, sample_transcription):
+    """Unindexed transcriptions fall back to the full content."""
+    selected = await select_relevant_content(
+        db_session, sample_transcription.id, _LONG_CONTENT, "zzzz"
+    )
+    assert selected == _LONG_CONTENT
+
+async def test_select_relevant_content_embedding_error(
+    db_session: Session, sample_transcription, mock_openai, monkeypatch
+):
+    """A failed query embedding falls back to the full content."""
+    await index_transcription(db_session, sample_transcription.id, _LONG_CONTENT)
+
+    async def fail(**kwargs):
+        raise RuntimeError("embeddings unavailable")
+    monkeypatch.setattr(mock_openai.embeddings, "create", fail)
+
+    selected = await select_relevant_content(
+        db_session, sample_transcription.id, _LONG_CONTENT, "zzzz"
+    )
+    assert selected == _LONG_CONTENT
@@ -0,0 +1,89 @@
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+from starlette.testclient import TestClient
+from app.static_files import (
+    CachedStaticFiles,
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+)
+
+@pytest.fixture(scope="module")
+def frontend_dir(tmp_path_factory):
+    """Frontend build directory with a mix of asset names."""
+    directory = tmp_path_factory.mktemp("frontend")
+    for name in (
+        "index.html",
+        "report-20241015.pdf",
+        "main.3f2a9c1b.js",
+        "_next/static/chunks/app-3f2a9c1b.js",
+        "_next/static/css/layout.css",
+    ):
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name)
+    return directory
+
+@pytest.fixture(scope="module")
+def static_client(frontend_dir):
+    """Client for a frontend directory served by CachedStaticFiles."""
+    app = Starlette(routes=[
+        Mount("/", CachedStaticFiles(directory=frontend_dir, html=True), name="frontend")
+    ])
+    with TestClient(app) as client:
+        yield client
+
+@pytest.mark.parametrize("path", [
+    "/_next/static/chunks/app-3f2a9c1b.js",
+    "/_next/static/css/layout.css",
+])
+def test_next_build_assets_are_immutable(static_client, path):
+    """Next.js build assets may be cached for a year."""
+    response = static_client.get(path)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+
+@pytest.mark.parametrize("path", [
+    "/",
+    "/index.html",
+    "/report-20241015.pdf",
+    "/main.3f2a9c1b.js",
+])
+def test_other_files_are_revalidated(static_client, path):
+    """Files outside _next/static/ are revalidated, even with hash-like names."""
+    response = static_client.get(path)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == REVALIDATE_CACHE_CONTROL
+    assert "etag" in response.headers
+
+def test_missing_file_is_not_cached(static_client):
+    """A 404 under _next/static/ is not marked immutable."""
+    response = static_client.get("/_next/static/missing.js")
+    assert response.status_code == 404
+    assert response.headers.get("Cache-Control") != IMMUTABLE_CACHE_CONTROL
+
+def test_cached_lookups(frontend_dir, monkeypatch):
+    """With cache_lookups, hits skip the filesystem and misses are not kept."""
+    lookups = []
+    lookup_path = StaticFiles.lookup_path
+
+    def counting_lookup_path(self, path):
+        lookups.append(path)
+        return lookup_path(self, path)
+    monkeypatch.setattr(StaticFiles, "lookup_path", counting_lookup_path)
+
+    static_files = CachedStaticFiles(directory=frontend_dir, cache_lookups=True)
+    client = TestClient(Starlette(routes=[Mount("/", static_files)]))
+
+    for _ in range(2):
+        response = client.get("/_next/static/css/layout.css")
+        assert response.status_code == 200
+        assert response.text == "_next/static/css/layout.css"
+    assert lookups == ["_next/static/css/layout.css"]
+    assert set(static_files._lookup_cache) == {"_next/static/css/layout.css"}
+
+    for _ in range(2):
+        assert client.get("/missing.js").status_code == 404
+    assert lookups.count("missing.js") == 2
+    assert "missing.js" not in static_files._lookup_cache